@@ -1,3 +1,5 @@
+from collections import Counter
+
 import openmdao.api as om
 
 from mphys.core import Builder, CouplingGroup, MPhysVariables, Scenario
@@ -79,6 +81,14 @@ class ScenarioAeroStructural(Scenario):
                     f"""Unknown pre/post order option: {option}. valid options are ["{'", "'.join(valid_options)}"]"""
                 )
 
+        repeated = [
+            option for option, count in Counter(given_options).items() if count > 1
+        ]
+        if repeated:
+            raise ValueError(
+                f"Repeated items in the pre/post coupling order list: {repeated}"
+            )
+
     def _mphys_add_pre_coupling_subsystems(self):
         self._mphys_check_coupling_order_inputs(self.options["pre_coupling_order"])
         for discipline in self.options["pre_coupling_order"]:
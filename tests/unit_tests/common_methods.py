@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import List, Tuple
 
 import openmdao.api as om
 
@@ -22,13 +22,15 @@ class CommonMethods:
         for output in obj.prob.model._conn_global_abs_in2out.values():
             obj.assertFalse("auto_ivc" in output)
 
+    def test_components_were_added(
+        self, obj, group, expected_components: List[Tuple[str, type]]
+    ):
+        for name, expected_type in expected_components:
+            with obj.subTest(component=name):
+                obj.assertIsInstance(getattr(group, name), expected_type)
+
     def test_subsystem_order(self, obj, group, expected_order: List[str]):
-        systems = group._subsystems_allprocs
-        for name, subsystem in systems.items():
-            for expected_index, expected_name in enumerate(expected_order):
-                if name == expected_name:
-                    obj.assertEqual(subsystem.index, expected_index)
-                    break
-            else:
-                print("Unknown component", name)
-                obj.assertTrue(False)
+        expected_indices = {name: index for index, name in enumerate(expected_order)}
+        for name, subsystem in group._subsystems_allprocs.items():
+            obj.assertIn(name, expected_indices, "Unknown component")
+            obj.assertEqual(subsystem.index, expected_indices[name])
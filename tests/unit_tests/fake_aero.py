@@ -52,8 +52,11 @@ class AeroPostCouplingComp(om.ExplicitComponent):
         self.add_output("func_aero", val=1.0, tags=["mphys_result"])
 
     def compute(self, inputs, outputs):
-        outputs["func_aero"] = np.sum(
-            inputs[self.loads_name] + inputs["prestate_aero"] + inputs[self.coords_name]
+        coords = inputs[self.coords_name]
+        outputs["func_aero"] = (
+            inputs[self.loads_name].sum()
+            + coords.sum()
+            + coords.size * inputs["prestate_aero"]
         )
 
 
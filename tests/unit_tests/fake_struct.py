@@ -55,10 +55,11 @@ class StructPostCouplingComp(om.ExplicitComponent):
         self.add_output("func_struct", val=1.0, tags=["mphys_result"])
 
     def compute(self, inputs, outputs):
-        outputs["func_struct"] = np.sum(
-            inputs[self.disps_name]
-            + inputs["prestate_struct"]
-            + inputs[self.coords_name]
+        coords = inputs[self.coords_name]
+        outputs["func_struct"] = (
+            inputs[self.disps_name].sum()
+            + coords.sum()
+            + coords.size * inputs["prestate_struct"]
         )
 
 
@@ -1,6 +1,6 @@
+import functools
 import unittest
 
-import numpy as np
 import openmdao.api as om
 from common_methods import CommonMethods
 from fake_aero import (
@@ -19,7 +19,7 @@ from fake_struct import (
     StructPostCouplingComp,
     StructPreCouplingComp,
 )
-from mpi4py import MPI
+from openmdao.utils.mpi import MPI, FakeComm
 
 from mphys import MPhysVariables
 from mphys.scenarios.aerostructural import (
@@ -28,77 +28,123 @@ from mphys.scenarios.aerostructural import (
 )
 from mphys.scenarios.geo_disp import GeoDisp
 
-
-class TestScenarioAeroStructural(unittest.TestCase):
-    def setUp(self):
-        self.common = CommonMethods()
-        self.prob = om.Problem()
-
-        aero_builder = AeroBuilder()
-        struct_builder = StructBuilder()
-        ldxfer_builder = LDXferBuilder(aero_builder, struct_builder)
-
-        aero_builder.initialize(MPI.COMM_WORLD)
-        struct_builder.initialize(MPI.COMM_WORLD)
-        ldxfer_builder.initialize(MPI.COMM_WORLD)
-
-        self.prob.model.add_subsystem(
-            "aero_mesh", aero_builder.get_mesh_coordinate_subsystem()
-        )
-        self.prob.model.add_subsystem(
-            "struct_mesh", struct_builder.get_mesh_coordinate_subsystem()
-        )
-        self.prob.model.add_subsystem(
-            "scenario",
-            ScenarioAeroStructural(
-                aero_builder=aero_builder,
-                struct_builder=struct_builder,
-                ldxfer_builder=ldxfer_builder,
-            ),
-        )
-        self.prob.model.connect(
-            f"aero_mesh.{MPhysVariables.Aerodynamics.Surface.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Aerodynamics.Surface.COORDINATES_INITIAL}",
-        )
-
-        self.prob.model.connect(
-            f"struct_mesh.{MPhysVariables.Structures.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Structures.COORDINATES}",
-        )
-        self.prob.setup()
+_AERO_MESH_COORDS = f"aero_mesh.{MPhysVariables.Aerodynamics.Surface.Mesh.COORDINATES}"
+_STRUCT_MESH_COORDS = f"struct_mesh.{MPhysVariables.Structures.Mesh.COORDINATES}"
+_SCENARIO_AERO_COORDS_INITIAL = (
+    f"scenario.{MPhysVariables.Aerodynamics.Surface.COORDINATES_INITIAL}"
+)
+_SCENARIO_AERO_COORDS = f"scenario.{MPhysVariables.Aerodynamics.Surface.COORDINATES}"
+_SCENARIO_STRUCT_COORDS = f"scenario.{MPhysVariables.Structures.COORDINATES}"
+
+
+def _get_comm():
+    """
+    COMM_WORLD when running under MPI, otherwise OpenMDAO's serial stand-in so
+    the serial tests do not need to initialize MPI
+    """
+    return MPI.COMM_WORLD if MPI else FakeComm()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_initialized_builders(aero_builder_class, struct_builder_class):
+    """
+    Initialized (aero, struct, ldxfer) builders shared by the tests that
+    use the same builder classes. Not for in_MultipointParallel scenarios,
+    which must initialize their own builders with the scenario's comm
+    """
+    aero_builder = aero_builder_class()
+    struct_builder = struct_builder_class()
+    ldxfer_builder = LDXferBuilder(aero_builder, struct_builder)
+
+    comm = _get_comm()
+    aero_builder.initialize(comm)
+    struct_builder.initialize(comm)
+    ldxfer_builder.initialize(comm)
+    return aero_builder, struct_builder, ldxfer_builder
+
+
+def _make_prob(
+    scenario_kwargs,
+    aero_builder_class=AeroBuilder,
+    struct_builder_class=StructBuilder,
+    connect_aero_coords=False,
+):
+    """
+    Set up a problem with aero and struct mesh components feeding an
+    aerostructural scenario that uses the shared builders. If
+    connect_aero_coords, the aero mesh also provides the deformed aero
+    coordinates, for scenarios without the displacement transfer
+    """
+    prob = om.Problem()
+
+    aero_builder, struct_builder, ldxfer_builder = _get_initialized_builders(
+        aero_builder_class, struct_builder_class
+    )
+
+    prob.model.add_subsystem("aero_mesh", aero_builder.get_mesh_coordinate_subsystem())
+    prob.model.add_subsystem(
+        "struct_mesh", struct_builder.get_mesh_coordinate_subsystem()
+    )
+    prob.model.add_subsystem(
+        "scenario",
+        ScenarioAeroStructural(
+            aero_builder=aero_builder,
+            struct_builder=struct_builder,
+            ldxfer_builder=ldxfer_builder,
+            **scenario_kwargs,
+        ),
+    )
+    prob.model.connect(_AERO_MESH_COORDS, _SCENARIO_AERO_COORDS_INITIAL)
+    if connect_aero_coords:
+        prob.model.connect(_AERO_MESH_COORDS, _SCENARIO_AERO_COORDS)
+
+    prob.model.connect(_STRUCT_MESH_COORDS, _SCENARIO_STRUCT_COORDS)
+    prob.setup(check=False, derivatives=False)
+    return prob
+
+
+class ScenarioAeroStructuralTests:
+    """
+    Tests shared by every aerostructural scenario configuration below. Each
+    TestCase sets up cls.prob once in setUpClass and lists the components it
+    expects in the scenario
+    """
+
+    common = CommonMethods()
+    expected_scenario_components = []
 
     def test_run_model(self):
         self.common.test_run_model(self)
 
     def test_scenario_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.aero_pre, AeroPreCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_pre, StructPreCouplingComp
-        )
-        self.assertIsInstance(self.prob.model.scenario.coupling, CouplingAeroStructural)
-        self.assertIsInstance(self.prob.model.scenario.aero_post, AeroPostCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_post, StructPostCouplingComp
+        self.common.test_components_were_added(
+            self, self.prob.model.scenario, self.expected_scenario_components
         )
 
     def test_scenario_subsystem_order(self):
-        expected_order = [
-            "aero_pre",
-            "struct_pre",
-            "coupling",
-            "aero_post",
-            "struct_post",
-        ]
+        expected_order = [name for name, _ in self.expected_scenario_components]
         self.common.test_subsystem_order(self, self.prob.model.scenario, expected_order)
 
+    def test_no_autoivcs(self):
+        self.common.test_no_autoivcs(self)
+
+
+class CouplingAeroStructuralTests:
+    """
+    Tests for scenarios that use the full CouplingAeroStructural group
+    """
+
     def test_coupling_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.coupling.aero, AeroCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.coupling.struct, StructCouplingComp
+        expected_components = [
+            ("aero", AeroCouplingComp),
+            ("struct", StructCouplingComp),
+            ("disp_xfer", DispXferComp),
+            ("load_xfer", LoadXferComp),
+            ("geo_disp", GeoDisp),
+        ]
+        self.common.test_components_were_added(
+            self, self.prob.model.scenario.coupling, expected_components
         )
-        self.assertIsInstance(self.prob.model.scenario.coupling.disp_xfer, DispXferComp)
-        self.assertIsInstance(self.prob.model.scenario.coupling.load_xfer, LoadXferComp)
-        self.assertIsInstance(self.prob.model.scenario.coupling.geo_disp, GeoDisp)
 
     def test_coupling_subsystem_order(self):
         expected_order = ["disp_xfer", "geo_disp", "aero", "load_xfer", "struct"]
@@ -106,20 +152,45 @@ class TestScenarioAeroStructural(unittest.TestCase):
             self, self.prob.model.scenario.coupling, expected_order
         )
 
-    def test_no_autoivcs(self):
-        self.common.test_no_autoivcs(self)
-
 
-class TestScenarioAeroStructuralParallel(unittest.TestCase):
-    def setUp(self):
-        self.common = CommonMethods()
-        self.prob = om.Problem()
+class TestScenarioAeroStructural(
+    ScenarioAeroStructuralTests, CouplingAeroStructuralTests, unittest.TestCase
+):
+    expected_scenario_components = [
+        ("aero_pre", AeroPreCouplingComp),
+        ("struct_pre", StructPreCouplingComp),
+        ("coupling", CouplingAeroStructural),
+        ("aero_post", AeroPostCouplingComp),
+        ("struct_post", StructPostCouplingComp),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.prob = _make_prob({})
+
+
+class TestScenarioAeroStructuralParallel(
+    ScenarioAeroStructuralTests, CouplingAeroStructuralTests, unittest.TestCase
+):
+    expected_scenario_components = [
+        ("aero_mesh", AeroMeshComp),
+        ("struct_mesh", StructMeshComp),
+        ("aero_pre", AeroPreCouplingComp),
+        ("struct_pre", StructPreCouplingComp),
+        ("coupling", CouplingAeroStructural),
+        ("aero_post", AeroPostCouplingComp),
+        ("struct_post", StructPostCouplingComp),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.prob = om.Problem()
 
         aero_builder = AeroBuilder()
         struct_builder = StructBuilder()
         ldxfer_builder = LDXferBuilder(aero_builder, struct_builder)
 
-        self.prob.model.add_subsystem(
+        cls.prob.model.add_subsystem(
             "scenario",
             ScenarioAeroStructural(
                 aero_builder=aero_builder,
@@ -128,59 +199,26 @@ class TestScenarioAeroStructuralParallel(unittest.TestCase):
                 in_MultipointParallel=True,
             ),
         )
-        self.prob.setup()
-
-    def test_run_model(self):
-        self.common.test_run_model(self)
+        cls.prob.setup(check=False, derivatives=False)
 
-    def test_scenario_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.aero_mesh, AeroMeshComp)
-        self.assertIsInstance(self.prob.model.scenario.struct_mesh, StructMeshComp)
-        self.assertIsInstance(self.prob.model.scenario.aero_pre, AeroPreCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_pre, StructPreCouplingComp
-        )
-        self.assertIsInstance(self.prob.model.scenario.coupling, CouplingAeroStructural)
-        self.assertIsInstance(self.prob.model.scenario.aero_post, AeroPostCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_post, StructPostCouplingComp
-        )
 
-    def test_no_autoivcs(self):
-        self.common.test_no_autoivcs(self)
+class TestScenarioAeroStructuralParallelWithGeometry(
+    ScenarioAeroStructuralTests, CouplingAeroStructuralTests, unittest.TestCase
+):
+    expected_scenario_components = [
+        ("aero_mesh", AeroMeshComp),
+        ("struct_mesh", StructMeshComp),
+        ("geometry", Geometry),
+        ("aero_pre", AeroPreCouplingComp),
+        ("struct_pre", StructPreCouplingComp),
+        ("coupling", CouplingAeroStructural),
+        ("aero_post", AeroPostCouplingComp),
+        ("struct_post", StructPostCouplingComp),
+    ]
 
-    def test_scenario_subsystem_order(self):
-        expected_order = [
-            "aero_mesh",
-            "struct_mesh",
-            "aero_pre",
-            "struct_pre",
-            "coupling",
-            "aero_post",
-            "struct_post",
-        ]
-        self.common.test_subsystem_order(self, self.prob.model.scenario, expected_order)
-
-    def test_coupling_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.coupling.aero, AeroCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.coupling.struct, StructCouplingComp
-        )
-        self.assertIsInstance(self.prob.model.scenario.coupling.disp_xfer, DispXferComp)
-        self.assertIsInstance(self.prob.model.scenario.coupling.load_xfer, LoadXferComp)
-        self.assertIsInstance(self.prob.model.scenario.coupling.geo_disp, GeoDisp)
-
-    def test_coupling_subsystem_order(self):
-        expected_order = ["disp_xfer", "geo_disp", "aero", "load_xfer", "struct"]
-        self.common.test_subsystem_order(
-            self, self.prob.model.scenario.coupling, expected_order
-        )
-
-
-class TestScenarioAeroStructuralParallelWithGeometry(unittest.TestCase):
-    def setUp(self):
-        self.common = CommonMethods()
-        self.prob = om.Problem()
+    @classmethod
+    def setUpClass(cls):
+        cls.prob = om.Problem()
 
         aero_builder = AeroBuilder()
         struct_builder = StructBuilder()
@@ -189,7 +227,7 @@ class TestScenarioAeroStructuralParallelWithGeometry(unittest.TestCase):
             ["aero", "struct"], [aero_builder, struct_builder]
         )
 
-        self.prob.model.add_subsystem(
+        cls.prob.model.add_subsystem(
             "scenario",
             ScenarioAeroStructural(
                 aero_builder=aero_builder,
@@ -199,68 +237,20 @@ class TestScenarioAeroStructuralParallelWithGeometry(unittest.TestCase):
                 in_MultipointParallel=True,
             ),
         )
-        self.prob.setup()
-
-    def test_run_model(self):
-        self.common.test_run_model(self)
-
-    def test_scenario_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.aero_mesh, AeroMeshComp)
-        self.assertIsInstance(self.prob.model.scenario.struct_mesh, StructMeshComp)
-        self.assertIsInstance(self.prob.model.scenario.geometry, Geometry)
-        self.assertIsInstance(self.prob.model.scenario.aero_pre, AeroPreCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_pre, StructPreCouplingComp
-        )
-        self.assertIsInstance(self.prob.model.scenario.coupling, CouplingAeroStructural)
-        self.assertIsInstance(self.prob.model.scenario.aero_post, AeroPostCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_post, StructPostCouplingComp
-        )
-
-    def test_no_autoivcs(self):
-        self.common.test_no_autoivcs(self)
-
-    def test_scenario_subsystem_order(self):
-        expected_order = [
-            "aero_mesh",
-            "struct_mesh",
-            "geometry",
-            "aero_pre",
-            "struct_pre",
-            "coupling",
-            "aero_post",
-            "struct_post",
-        ]
-        self.common.test_subsystem_order(self, self.prob.model.scenario, expected_order)
-
-    def test_coupling_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.coupling.aero, AeroCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.coupling.struct, StructCouplingComp
-        )
-        self.assertIsInstance(self.prob.model.scenario.coupling.disp_xfer, DispXferComp)
-        self.assertIsInstance(self.prob.model.scenario.coupling.load_xfer, LoadXferComp)
-        self.assertIsInstance(self.prob.model.scenario.coupling.geo_disp, GeoDisp)
-
-    def test_coupling_subsystem_order(self):
-        expected_order = ["disp_xfer", "geo_disp", "aero", "load_xfer", "struct"]
-        self.common.test_subsystem_order(
-            self, self.prob.model.scenario.coupling, expected_order
-        )
+        cls.prob.setup(check=False, derivatives=False)
 
 
 class StructPostCouplingCompForNoCoupling(om.ExplicitComponent):
+    coords_name = MPhysVariables.Structures.COORDINATES
+
     def setup(self):
-        self.coords_name = MPhysVariables.Structures.COORDINATES
         self.add_input("prestate_struct", tags=["mphys_coupling"])
         self.add_input(self.coords_name, shape_by_conn=True, tags=["mphys_coordinates"])
         self.add_output("func_struct", val=1.0, tags=["mphys_result"])
 
     def compute(self, inputs, outputs):
-        outputs["func_struct"] = np.sum(
-            inputs["prestate_struct"] + inputs[self.coords_name]
-        )
+        coords = inputs[self.coords_name]
+        outputs["func_struct"] = coords.sum() + coords.size * inputs["prestate_struct"]
 
 
 class StructBuilderNoCoupling(StructBuilder):
@@ -268,83 +258,37 @@ class StructBuilderNoCoupling(StructBuilder):
         return StructPostCouplingCompForNoCoupling()
 
 
-class TestScenarioAeroStructuralAeroOnlyInCoupling(unittest.TestCase):
-    def setUp(self):
-        self.common = CommonMethods()
-        self.prob = om.Problem()
-
-        aero_builder = AeroBuilder()
-        struct_builder = StructBuilderNoCoupling()
-        ldxfer_builder = LDXferBuilder(aero_builder, struct_builder)
-
-        aero_builder.initialize(MPI.COMM_WORLD)
-        struct_builder.initialize(MPI.COMM_WORLD)
-        ldxfer_builder.initialize(MPI.COMM_WORLD)
+class TestScenarioAeroStructuralAeroOnlyInCoupling(
+    ScenarioAeroStructuralTests, unittest.TestCase
+):
+    expected_scenario_components = [
+        ("aero_pre", AeroPreCouplingComp),
+        ("struct_pre", StructPreCouplingComp),
+        ("aero", AeroCouplingComp),
+        ("aero_post", AeroPostCouplingComp),
+        ("struct_post", StructPostCouplingCompForNoCoupling),
+    ]
 
-        self.prob.model.add_subsystem(
-            "aero_mesh", aero_builder.get_mesh_coordinate_subsystem()
-        )
-        self.prob.model.add_subsystem(
-            "struct_mesh", struct_builder.get_mesh_coordinate_subsystem()
-        )
-        self.prob.model.add_subsystem(
-            "scenario",
-            ScenarioAeroStructural(
-                aero_builder=aero_builder,
-                struct_builder=struct_builder,
-                ldxfer_builder=ldxfer_builder,
-                coupling_group_type="aerodynamics_only",
-            ),
-        )
-        self.prob.model.connect(
-            f"aero_mesh.{MPhysVariables.Aerodynamics.Surface.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Aerodynamics.Surface.COORDINATES_INITIAL}",
-        )
-        self.prob.model.connect(
-            f"aero_mesh.{MPhysVariables.Aerodynamics.Surface.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Aerodynamics.Surface.COORDINATES}",
-        )
-
-        self.prob.model.connect(
-            f"struct_mesh.{MPhysVariables.Structures.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Structures.COORDINATES}",
-        )
-        self.prob.setup()
-
-    def test_run_model(self):
-        self.common.test_run_model(self)
-
-    def test_scenario_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.aero_pre, AeroPreCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_pre, StructPreCouplingComp
-        )
-        self.assertIsInstance(self.prob.model.scenario.aero, AeroCouplingComp)
-        self.assertIsInstance(self.prob.model.scenario.aero_post, AeroPostCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_post, StructPostCouplingCompForNoCoupling
+    @classmethod
+    def setUpClass(cls):
+        cls.prob = _make_prob(
+            {"coupling_group_type": "aerodynamics_only"},
+            struct_builder_class=StructBuilderNoCoupling,
+            connect_aero_coords=True,
         )
 
-    def test_scenario_subsystem_order(self):
-        expected_order = ["aero_pre", "struct_pre", "aero", "aero_post", "struct_post"]
-        self.common.test_subsystem_order(self, self.prob.model.scenario, expected_order)
-
-    def test_no_autoivcs(self):
-        self.common.test_no_autoivcs(self)
-
 
 class AeroPostCouplingCompForNoCoupling(om.ExplicitComponent):
-    def setup(self):
-        self.coords_name = MPhysVariables.Aerodynamics.Surface.COORDINATES
+    coords_name = MPhysVariables.Aerodynamics.Surface.COORDINATES
 
+    def setup(self):
         self.add_input("prestate_aero", tags=["mphys_coupling"])
         self.add_input(self.coords_name, shape_by_conn=True, tags=["mphys_coordinates"])
         self.add_output("func_aero", val=1.0, tags=["mphys_result"])
 
     def compute(self, inputs, outputs):
-        outputs["func_aero"] = np.sum(
-            inputs["prestate_aero"] + inputs[self.coords_name]
-        )
+        coords = inputs[self.coords_name]
+        outputs["func_aero"] = coords.sum() + coords.size * inputs["prestate_aero"]
 
 
 class AeroBuilderNoCoupling(AeroBuilder):
@@ -352,136 +296,47 @@ class AeroBuilderNoCoupling(AeroBuilder):
         return AeroPostCouplingCompForNoCoupling()
 
 
-class TestScenarioAeroStructuralNoCoupling(unittest.TestCase):
-    def setUp(self):
-        self.common = CommonMethods()
-        self.prob = om.Problem()
-
-        aero_builder = AeroBuilderNoCoupling()
-        struct_builder = StructBuilderNoCoupling()
-        ldxfer_builder = LDXferBuilder(aero_builder, struct_builder)
-
-        aero_builder.initialize(MPI.COMM_WORLD)
-        struct_builder.initialize(MPI.COMM_WORLD)
-        ldxfer_builder.initialize(MPI.COMM_WORLD)
-
-        self.prob.model.add_subsystem(
-            "aero_mesh", aero_builder.get_mesh_coordinate_subsystem()
-        )
-        self.prob.model.add_subsystem(
-            "struct_mesh", struct_builder.get_mesh_coordinate_subsystem()
-        )
-        self.prob.model.add_subsystem(
-            "scenario",
-            ScenarioAeroStructural(
-                aero_builder=aero_builder,
-                struct_builder=struct_builder,
-                ldxfer_builder=ldxfer_builder,
-                coupling_group_type=None,
-            ),
-        )
-        self.prob.model.connect(
-            f"aero_mesh.{MPhysVariables.Aerodynamics.Surface.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Aerodynamics.Surface.COORDINATES_INITIAL}",
-        )
-        self.prob.model.connect(
-            f"aero_mesh.{MPhysVariables.Aerodynamics.Surface.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Aerodynamics.Surface.COORDINATES}",
-        )
-
-        self.prob.model.connect(
-            f"struct_mesh.{MPhysVariables.Structures.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Structures.COORDINATES}",
-        )
-        self.prob.setup()
-
-    def test_run_model(self):
-        self.common.test_run_model(self)
-
-    def test_scenario_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.aero_pre, AeroPreCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_pre, StructPreCouplingComp
-        )
-        self.assertIsInstance(
-            self.prob.model.scenario.aero_post, AeroPostCouplingCompForNoCoupling
-        )
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_post, StructPostCouplingCompForNoCoupling
-        )
-
-    def test_scenario_subsystem_order(self):
-        expected_order = ["aero_pre", "struct_pre", "aero_post", "struct_post"]
-        self.common.test_subsystem_order(self, self.prob.model.scenario, expected_order)
-
-    def test_no_autoivcs(self):
-        self.common.test_no_autoivcs(self)
-
-
-class TestScenarioAeroStructuralChangeOrderPreAndPostCoupling(unittest.TestCase):
-    def setUp(self):
-        self.common = CommonMethods()
-        self.prob = om.Problem()
-
-        aero_builder = AeroBuilder()
-        struct_builder = StructBuilder()
-        ldxfer_builder = LDXferBuilder(aero_builder, struct_builder)
-        self.pre_coupling_order = ["ldxfer", "struct", "aero"]
-        self.post_coupling_order = ["struct", "aero", "ldxfer"]
-
-        aero_builder.initialize(MPI.COMM_WORLD)
-        struct_builder.initialize(MPI.COMM_WORLD)
-        ldxfer_builder.initialize(MPI.COMM_WORLD)
-
-        self.prob.model.add_subsystem(
-            "aero_mesh", aero_builder.get_mesh_coordinate_subsystem()
-        )
-        self.prob.model.add_subsystem(
-            "struct_mesh", struct_builder.get_mesh_coordinate_subsystem()
+class TestScenarioAeroStructuralNoCoupling(
+    ScenarioAeroStructuralTests, unittest.TestCase
+):
+    expected_scenario_components = [
+        ("aero_pre", AeroPreCouplingComp),
+        ("struct_pre", StructPreCouplingComp),
+        ("aero_post", AeroPostCouplingCompForNoCoupling),
+        ("struct_post", StructPostCouplingCompForNoCoupling),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.prob = _make_prob(
+            {"coupling_group_type": None},
+            aero_builder_class=AeroBuilderNoCoupling,
+            struct_builder_class=StructBuilderNoCoupling,
+            connect_aero_coords=True,
+        )
+
+
+class TestScenarioAeroStructuralChangeOrderPreAndPostCoupling(
+    ScenarioAeroStructuralTests, unittest.TestCase
+):
+    expected_scenario_components = [
+        ("struct_pre", StructPreCouplingComp),
+        ("aero_pre", AeroPreCouplingComp),
+        ("coupling", CouplingAeroStructural),
+        ("struct_post", StructPostCouplingComp),
+        ("aero_post", AeroPostCouplingComp),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pre_coupling_order = ["ldxfer", "struct", "aero"]
+        cls.post_coupling_order = ["struct", "aero", "ldxfer"]
+        cls.prob = _make_prob(
+            {
+                "pre_coupling_order": cls.post_coupling_order,
+                "post_coupling_order": cls.post_coupling_order,
+            }
         )
-        self.prob.model.add_subsystem(
-            "scenario",
-            ScenarioAeroStructural(
-                aero_builder=aero_builder,
-                struct_builder=struct_builder,
-                ldxfer_builder=ldxfer_builder,
-                pre_coupling_order=self.post_coupling_order,
-                post_coupling_order=self.post_coupling_order,
-            ),
-        )
-        self.prob.model.connect(
-            f"aero_mesh.{MPhysVariables.Aerodynamics.Surface.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Aerodynamics.Surface.COORDINATES_INITIAL}",
-        )
-        self.prob.model.connect(
-            f"struct_mesh.{MPhysVariables.Structures.Mesh.COORDINATES}",
-            f"scenario.{MPhysVariables.Structures.COORDINATES}",
-        )
-        self.prob.setup()
-
-    def test_run_model(self):
-        self.common.test_run_model(self)
-
-    def test_scenario_components_were_added(self):
-        self.assertIsInstance(self.prob.model.scenario.aero_pre, AeroPreCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_pre, StructPreCouplingComp
-        )
-        self.assertIsInstance(self.prob.model.scenario.coupling, CouplingAeroStructural)
-        self.assertIsInstance(self.prob.model.scenario.aero_post, AeroPostCouplingComp)
-        self.assertIsInstance(
-            self.prob.model.scenario.struct_post, StructPostCouplingComp
-        )
-
-    def test_scenario_subsystem_order(self):
-        expected_order = [
-            "struct_pre",
-            "aero_pre",
-            "coupling",
-            "struct_post",
-            "aero_post",
-        ]
-        self.common.test_subsystem_order(self, self.prob.model.scenario, expected_order)
 
     def test_invalid_subsystem_order_spelling(self):
         bad_spelling = ["struct", "aero", "xfer"]
@@ -493,8 +348,10 @@ class TestScenarioAeroStructuralChangeOrderPreAndPostCoupling(unittest.TestCase)
         with self.assertRaises(ValueError):
             self.prob.model.scenario._mphys_check_coupling_order_inputs(too_long)
 
-    def test_no_autoivcs(self):
-        self.common.test_no_autoivcs(self)
+    def test_subsystem_order_repeated(self):
+        repeated = ["struct", "aero", "aero"]
+        with self.assertRaises(ValueError):
+            self.prob.model.scenario._mphys_check_coupling_order_inputs(repeated)
 
 
 if __name__ == "__main__":